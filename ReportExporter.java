@@ -1,4 +1,8 @@
+import java.io.BufferedReader;
 import java.io.File;
+import java.io.FileInputStream;
+import java.io.InputStreamReader;
+import java.nio.charset.StandardCharsets;
 
 import net.sf.jasperreports.engine.JasperExportManager;
 import net.sf.jasperreports.engine.JasperPrint;
@@ -13,19 +17,50 @@ public final class ReportExporter {
     }
 
     public static void main(String[] args) throws Exception {
+        if (args.length >= 2 && "--manifest".equals(args[0])) {
+            String format = args.length >= 3 ? args[2] : "csv";
+            exportManifest(new File(args[1]), format);
+            return;
+        }
         if (args.length < 3) {
             System.err.println("Usage: java ReportExporter <jrprint> <format> <output>");
+            System.err.println("       java ReportExporter --manifest <file> [format]");
+            System.err.println("Manifest lines are <jrprint>\\t<output>.");
             System.err.println("Formats supported: csv, pdf");
             System.exit(1);
         }
 
-        File jrprintFile = new File(args[0]);
+        export(new File(args[0]), args[1], new File(args[2]));
+    }
+
+    private static void exportManifest(File manifest, String format) throws Exception {
+        if (!manifest.isFile()) {
+            throw new IllegalArgumentException("Manifest file not found: " + manifest);
+        }
+        try (BufferedReader reader = new BufferedReader(
+                new InputStreamReader(new FileInputStream(manifest), StandardCharsets.UTF_8))) {
+            String line;
+            while ((line = reader.readLine()) != null) {
+                if (line.isEmpty()) {
+                    continue;
+                }
+                int tab = line.indexOf('\t');
+                if (tab < 0) {
+                    throw new IllegalArgumentException("Malformed manifest line: " + line);
+                }
+                File outputFile = new File(line.substring(tab + 1));
+                export(new File(line.substring(0, tab)), format, outputFile);
+                System.out.println("Exported " + outputFile);
+            }
+        }
+    }
+
+    private static void export(File jrprintFile, String formatName, File outputFile) throws Exception {
         if (!jrprintFile.isFile()) {
             throw new IllegalArgumentException("JRPrint file not found: " + jrprintFile);
         }
 
-        String format = args[1].toLowerCase();
-        File outputFile = new File(args[2]);
+        String format = formatName.toLowerCase();
         File parent = outputFile.getParentFile();
         if (parent != null && !parent.exists()) {
             if (!parent.mkdirs() && !parent.isDirectory()) {
@@ -2,4 +2,4 @@
 Utilities for replaying Blueprint OMS report workflows.
 """
 
-__all__ = ["config", "payloads", "sqs_replay", "s3_download", "jasper", "catalog"]
+__all__ = ["aws", "config", "payloads", "sqs_replay", "s3_download", "jasper", "catalog"]
@@ -0,0 +1,44 @@
+"""
+JSON helpers that prefer orjson when it is installed.
+
+Both backends speak bytes: ``loads`` accepts ``bytes`` or ``str`` and ``dumps``
+returns compact UTF-8 encoded ``bytes``. ``dumps_text`` returns the same
+document as ``str`` for APIs such as SQS that want text.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - stdlib fallback
+    orjson = None  # type: ignore
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one name covers both.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialise ``obj`` compactly, or with two-space indentation if ``indent``."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps_text(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
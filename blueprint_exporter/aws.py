@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import functools
+from typing import Any, TYPE_CHECKING
+
+try:
+    import boto3  # type: ignore
+    from botocore.config import Config  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - offline mode without boto3
+    boto3 = None  # type: ignore
+    Config = None  # type: ignore
+
+if TYPE_CHECKING:
+    from botocore.client import BaseClient  # type: ignore
+else:
+    BaseClient = Any  # type: ignore[misc, assignment]
+
+# Enough pooled connections for concurrent S3 transfers to reuse TLS sessions.
+MAX_POOL_CONNECTIONS = 50
+
+
+@functools.lru_cache(maxsize=None)
+def get_session(region_name: str) -> Any:
+    """
+    Return the process-wide boto3 session for a region.
+
+    Building a Session reloads botocore's service data, so do it once.
+    """
+    if boto3 is None:
+        raise ModuleNotFoundError("boto3 is required for live mode AWS access.")
+    return boto3.session.Session(region_name=region_name)
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(service_name: str, region_name: str) -> BaseClient:
+    """
+    Return a cached client so repeated calls share one HTTPS connection pool.
+    """
+    if boto3 is None:
+        raise ModuleNotFoundError(
+            f"boto3 is required for live mode {service_name.upper()} access."
+        )
+    config = Config(max_pool_connections=MAX_POOL_CONNECTIONS, tcp_keepalive=True)
+    return get_session(region_name).client(service_name, config=config)
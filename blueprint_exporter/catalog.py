@@ -5,14 +5,20 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List
 
+from . import _json
+
 
 def _read_envelope(path: Path) -> dict:
     data = path.read_bytes()
-    end = data.rfind(b"}")
-    if end == -1:
-        raise ValueError(f"Could not locate JSON terminator in {path}.")
-    trimmed = data[: end + 1]
-    return json.loads(trimmed.decode("utf-8"))
+    try:
+        return _json.loads(data)
+    except _json.JSONDecodeError:
+        pass
+    # Captured envelopes can carry trailing bytes after the JSON document;
+    # raw_decode stops at the end of the first value and ignores the rest.
+    text = data.decode("utf-8", errors="replace").lstrip()
+    envelope, _end = json.JSONDecoder().raw_decode(text)
+    return envelope
 
 
 @dataclass(frozen=True)
@@ -27,7 +33,7 @@ class ReportEntry:
 def load_catalog(path: Path) -> List[ReportEntry]:
     envelope = _read_envelope(path)
     payload_raw = envelope["Message"]
-    payload = json.loads(payload_raw)
+    payload = _json.loads(payload_raw)
 
     entries: List[ReportEntry] = []
     for category in payload.get("allowedCategories", []):
@@ -46,9 +52,5 @@ def load_catalog(path: Path) -> List[ReportEntry]:
 
 
 def iter_names(entries: Iterable[ReportEntry]) -> Iterable[str]:
-    seen = set()
-    for entry in entries:
-        if entry.description in seen:
-            continue
-        seen.add(entry.description)
-        yield entry.description
+    # dict.fromkeys keeps the first occurrence of each name, in order.
+    return iter(dict.fromkeys(entry.description for entry in entries))
@@ -1,25 +1,64 @@
 from __future__ import annotations
 
 import gzip
-import shutil
+import os
 import subprocess
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import BinaryIO, Iterable, Optional
 
+try:
+    import rapidgzip  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional accelerator
+    rapidgzip = None  # type: ignore
 
-def decompress_jasperprint(source: Path, destination: Path) -> Path:
+try:
+    from isal import igzip  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional accelerator
+    igzip = None  # type: ignore
+
+COPY_BUFFER_SIZE = 128 * 1024
+
+
+def _open_gzip(source: Path) -> BinaryIO:
+    """
+    Open a gzip file with the fastest available backend.
+
+    rapidgzip inflates on all cores, ISA-L's igzip is a faster single-threaded
+    drop-in for the stdlib module, and gzip is the fallback.
+    """
+    if rapidgzip is not None:
+        return rapidgzip.open(str(source), parallelization=os.cpu_count() or 1)
+    if igzip is not None:
+        return igzip.open(source, "rb")
+    return gzip.open(source, "rb")
+
+
+def _inflate_to(compressed: BinaryIO, destination: Path) -> Path:
     destination.parent.mkdir(parents=True, exist_ok=True)
-    with gzip.open(source, "rb") as compressed, destination.open("wb") as handle:
-        try:
-            shutil.copyfileobj(compressed, handle)
-        except gzip.BadGzipFile:
-            # Some captured artefacts include trailing bytes after the gzip member.
-            # The useful payload is already written before the exception fires.
-            if destination.stat().st_size == 0:
-                raise
+    with destination.open("wb") as handle:
+        # read1() performs at most one underlying read, so a failing call never
+        # discards data that was already inflated into its buffer.
+        read = getattr(compressed, "read1", compressed.read)
+        while True:
+            try:
+                chunk = read(COPY_BUFFER_SIZE)
+            except gzip.BadGzipFile:
+                # Some captured artefacts include trailing bytes after the gzip member.
+                # The useful payload is already written before the exception fires.
+                if handle.tell() == 0:
+                    raise
+                break
+            if not chunk:
+                break
+            handle.write(chunk)
     return destination
 
 
+def decompress_jasperprint(source: Path, destination: Path) -> Path:
+    with _open_gzip(source) as compressed:
+        return _inflate_to(compressed, destination)
+
+
 def export_with_jasperstarter(
     jrprint_path: Path,
     *,
@@ -30,13 +69,15 @@ def export_with_jasperstarter(
     """
     Invoke jasperstarter CLI to export a JasperPrint file.
 
+    All formats are rendered by a single jasperstarter run, so the JVM and the
+    JasperReports classpath are loaded once per report rather than per format.
+
     Example:
-        jasperstarter pr report.jrprint -f xls -o output/report
+        jasperstarter pr report.jrprint -f pdf xls -o output/report
     """
     output_dir.mkdir(parents=True, exist_ok=True)
-    format_args = []
-    for fmt in formats:
-        format_args.extend(["-f", fmt])
+    format_list = list(formats)
+    format_args = ["-f", *format_list] if format_list else []
     command = [
         str(jasperstarter),
         "pr",
@@ -45,4 +86,5 @@ def export_with_jasperstarter(
         "-o",
         str(output_dir / jrprint_path.stem),
     ]
-    subprocess.run(command, check=True)
+    # Progress chatter is not useful to callers; errors still reach stderr.
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from . import _json
 
 
 _REPORT_ALIASES: Dict[str, str] = {
@@ -12,10 +13,30 @@ _REPORT_ALIASES: Dict[str, str] = {
 }
 
 
+def _alias_chain(report_name: str) -> Tuple[str, ...]:
+    chain = [report_name]
+    current = _REPORT_ALIASES.get(report_name)
+    while current is not None and current not in chain:
+        chain.append(current)
+        current = _REPORT_ALIASES.get(current)
+    return tuple(chain)
+
+
+# Lookup order for every aliased name, resolved once at import time.
+_ALIAS_CHAINS: Dict[str, Tuple[str, ...]] = {
+    name: _alias_chain(name) for name in _REPORT_ALIASES
+}
+
+
 @dataclass(frozen=True)
 class ReportRequest:
     message: Dict[str, Any]
     attributes: Dict[str, str]
+    # Serialised forms, filled on first use. Build a new ReportRequest rather
+    # than mutating ``message`` once it has been sent.
+    _serialised: Dict[str, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @property
     def report_name(self) -> Optional[str]:
@@ -28,7 +49,11 @@ class ReportRequest:
         }
 
     def message_json(self) -> str:
-        return json.dumps(self.message, separators=(",", ":"), sort_keys=False)
+        cached = self._serialised.get("message")
+        if cached is None:
+            cached = _json.dumps_text(self.message)
+            self._serialised["message"] = cached
+        return cached
 
     def sqs_attributes(self) -> Dict[str, Dict[str, str]]:
         return {
@@ -37,7 +62,11 @@ class ReportRequest:
         }
 
     def message_body(self) -> str:
-        return json.dumps(self.envelope(), separators=(",", ":"), sort_keys=False)
+        cached = self._serialised.get("body")
+        if cached is None:
+            cached = _json.dumps_text(self.envelope())
+            self._serialised["body"] = cached
+        return cached
 
 
 @dataclass(frozen=True)
@@ -53,50 +82,88 @@ class ReportResponse:
         return self.message.get("reportResultXml")
 
 
+_Named = TypeVar("_Named", ReportRequest, ReportResponse)
+
+
+def _index_by_name(items: Iterable[_Named]) -> Dict[str, _Named]:
+    # The first entry for a report name wins, matching the old linear scans.
+    index: Dict[str, _Named] = {}
+    for item in items:
+        name = item.report_name
+        if name is not None:
+            index.setdefault(name, item)
+    return index
+
+
 @dataclass(frozen=True)
 class ReportMessages:
     requests: List[ReportRequest]
     responses: List[ReportResponse]
     s3_pointers: List[Dict[str, Any]]
     notifications: List[Dict[str, Any]]
+    _requests_by_name: Dict[str, ReportRequest] = field(
+        init=False, repr=False, compare=False
+    )
+    _responses_by_name: Dict[str, ReportResponse] = field(
+        init=False, repr=False, compare=False
+    )
+    _s3_keys_by_bucket: Dict[str, Optional[str]] = field(
+        init=False, repr=False, compare=False
+    )
 
-    def _candidate_names(self, report_name: str) -> Iterable[str]:
-        seen = set()
-        current = report_name
-        while current not in seen:
-            yield current
-            seen.add(current)
-            mapped = _REPORT_ALIASES.get(current)
-            if mapped is None:
-                break
-            current = mapped
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_requests_by_name", _index_by_name(self.requests))
+        object.__setattr__(self, "_responses_by_name", _index_by_name(self.responses))
+        keys_by_bucket: Dict[str, Optional[str]] = {}
+        for pointer in self.s3_pointers:
+            bucket = pointer.get("s3BucketName")
+            if bucket is not None:
+                keys_by_bucket.setdefault(bucket, pointer.get("s3Key"))
+        object.__setattr__(self, "_s3_keys_by_bucket", keys_by_bucket)
+
+    def _candidate_names(self, report_name: str) -> Tuple[str, ...]:
+        return _ALIAS_CHAINS.get(report_name, (report_name,))
 
     def request_by_name(self, report_name: str) -> ReportRequest:
         for candidate in self._candidate_names(report_name):
-            for request in self.requests:
-                if request.report_name == candidate:
-                    return request
+            request = self._requests_by_name.get(candidate)
+            if request is not None:
+                return request
         raise KeyError(f"Report request for '{report_name}' not found.")
 
     def response_by_name(self, report_name: str) -> ReportResponse:
         for candidate in self._candidate_names(report_name):
-            for response in self.responses:
-                if response.report_name == candidate:
-                    return response
+            response = self._responses_by_name.get(candidate)
+            if response is not None:
+                return response
         raise KeyError(f"Report response for '{report_name}' not found.")
 
+    def s3_key_for_bucket(self, bucket_name: str) -> Optional[str]:
+        """Return the key of the first captured S3 pointer into ``bucket_name``."""
+        return self._s3_keys_by_bucket.get(bucket_name)
+
+
+def _coerce_attributes(attributes_raw: Dict[str, Any]) -> Dict[str, str]:
+    attributes: Dict[str, str] = {}
+    for key, value in attributes_raw.items():
+        if isinstance(value, dict) and "StringValue" in value:
+            attributes[key] = value["StringValue"]
+        elif isinstance(value, str):
+            attributes[key] = value
+    return attributes
+
 
 def _load_requests(raw: Iterable[Dict[str, Any]]) -> List[ReportRequest]:
     requests: List[ReportRequest] = []
     for entry in raw:
         message = entry.get("message", {})
         attributes_raw = entry.get("attributes", {})
-        attributes: Dict[str, str] = {}
-        for key, value in attributes_raw.items():
-            if isinstance(value, dict) and "StringValue" in value:
-                attributes[key] = value["StringValue"]
-            elif isinstance(value, str):
-                attributes[key] = value
+        try:
+            # Captures store SQS MessageAttributes verbatim, so every value is a
+            # {"DataType": ..., "StringValue": ...} dict; skip per-value checks.
+            attributes = {key: value["StringValue"] for key, value in attributes_raw.items()}
+        except (KeyError, TypeError):
+            attributes = _coerce_attributes(attributes_raw)
         requests.append(ReportRequest(message=message, attributes=attributes))
     return requests
 
@@ -111,7 +178,7 @@ def _load_responses(raw: Iterable[Dict[str, Any]]) -> List[ReportResponse]:
 
 
 def load_processed_messages(path: Path) -> ReportMessages:
-    data = json.loads(path.read_text())
+    data = _json.loads(path.read_bytes())
     return ReportMessages(
         requests=_load_requests(data.get("report_requests", [])),
         responses=_load_responses(data.get("report_responses", [])),
@@ -1,24 +1,83 @@
 from __future__ import annotations
 
+import functools
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Mapping, Optional, TYPE_CHECKING
 
 try:
-    import boto3  # type: ignore
+    import reflink  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - copy-on-write clones are optional
+    reflink = None  # type: ignore
+
+try:
+    from boto3.s3.transfer import S3Transfer, TransferConfig  # type: ignore
 except ModuleNotFoundError:  # pragma: no cover - offline mode without boto3
-    boto3 = None  # type: ignore
+    S3Transfer = None  # type: ignore
+    TransferConfig = None  # type: ignore
 
 if TYPE_CHECKING:
     from botocore.client import BaseClient  # type: ignore
 else:
     BaseClient = Any  # type: ignore[misc, assignment]
 
+from .aws import MAX_POOL_CONNECTIONS, get_client
+
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+# Objects above the threshold are fetched as concurrent ranged GETs.
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MAX_TRANSFER_CONCURRENCY = 10
+
 
 def create_s3_client(region_name: str) -> BaseClient:
-    if boto3 is None:
-        raise ModuleNotFoundError("boto3 is required for live mode S3 access.")
-    return boto3.client("s3", region_name=region_name)
+    return get_client("s3", region_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _transfer_config(max_concurrency: int = MAX_TRANSFER_CONCURRENCY) -> Any:
+    return TransferConfig(
+        multipart_threshold=MULTIPART_THRESHOLD,
+        multipart_chunksize=MULTIPART_THRESHOLD,
+        max_concurrency=max_concurrency,
+        io_chunksize=DOWNLOAD_BUFFER_SIZE,
+        use_threads=True,
+    )
+
+
+def _index_files(directory: str, prefix: str, index: Dict[str, Path]) -> None:
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            relative = prefix + entry.name
+            if entry.is_dir():
+                _index_files(entry.path, relative + "/", index)
+            else:
+                index.setdefault(relative, Path(entry.path))
+
+
+@functools.lru_cache(maxsize=8)
+def _build_cache_index(root: Path) -> Dict[str, Path]:
+    """
+    Map S3 keys to captured copies under captures/<date>/s3/.
+
+    Built once per project root; call ``_build_cache_index.cache_clear()`` after
+    adding captures while the process is running.
+    """
+    index: Dict[str, Path] = {}
+    # Let scandir report missing directories instead of stat-ing each one first;
+    # DirEntry.is_dir() answers from the directory listing itself.
+    try:
+        with os.scandir(root / "captures") as entries:
+            date_dirs = sorted(entry.path for entry in entries if entry.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
+        return index
+    for date_dir in date_dirs:
+        try:
+            _index_files(os.path.join(date_dir, "s3"), "", index)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return index
 
 
 def resolve_cached_object(root: Path, key: str) -> Optional[Path]:
@@ -27,14 +86,79 @@ def resolve_cached_object(root: Path, key: str) -> Optional[Path]:
 
     Captured artefacts live under captures/<date>/s3/.
     """
-    captures_dir = root / "captures"
-    if not captures_dir.exists():
-        return None
-    for date_dir in captures_dir.iterdir():
-        candidate = date_dir / "s3" / key
-        if candidate.exists():
-            return candidate
-    return None
+    return _build_cache_index(root).get(key)
+
+
+def _discard_existing(path: Path) -> None:
+    # Output paths may be hardlinks into captures/; replace them rather than
+    # writing through the link into a captured artefact.
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def link_or_copy(source: Path, destination: Path) -> Path:
+    """
+    Materialise ``source`` at ``destination`` without copying bytes if possible.
+
+    Captured artefacts are read-only, so a hardlink is safe. Across filesystems
+    fall back to a reflink clone and finally to a regular copy.
+    """
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    _discard_existing(destination)
+    try:
+        os.link(source, destination)
+        return destination
+    except OSError:
+        pass
+    if reflink is not None:
+        try:
+            reflink.reflink(str(source), str(destination))
+            return destination
+        except Exception:
+            pass
+    shutil.copyfile(source, destination)
+    return destination
+
+
+class _HeadRecorder:
+    """
+    Client proxy that remembers the ETag from the transfer manager's HeadObject.
+
+    The transfer manager always sends HeadObject to size the download, so the
+    ETag comes for free instead of costing a round trip of our own.
+    """
+
+    def __init__(self, client: BaseClient) -> None:
+        self._client = client
+        self.etag: Optional[str] = None
+
+    def head_object(self, **kwargs: Any) -> Dict[str, Any]:
+        response = self._client.head_object(**kwargs)
+        self.etag = response.get("ETag")
+        return response
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+def _download(
+    s3: BaseClient,
+    bucket: str,
+    key: str,
+    destination: Path,
+    max_concurrency: int = MAX_TRANSFER_CONCURRENCY,
+) -> Optional[str]:
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    recorder = _HeadRecorder(s3)
+    # The context manager shuts the transfer manager's worker threads down.
+    with S3Transfer(client=recorder, config=_transfer_config(max_concurrency)) as transfer:
+        transfer.download_file(bucket, key, str(destination))
+    if recorder.etag is None:
+        # Transfer clients that bypass the proxy (e.g. CRT) never report it.
+        recorder.etag = s3.head_object(Bucket=bucket, Key=key).get("ETag")
+    return recorder.etag
 
 
 def download_object(
@@ -43,14 +167,30 @@ def download_object(
     bucket: str,
     key: str,
     destination: Path,
+    max_concurrency: int = MAX_TRANSFER_CONCURRENCY,
 ) -> Path:
-    destination.parent.mkdir(parents=True, exist_ok=True)
-    response = s3.get_object(Bucket=bucket, Key=key)
-    with destination.open("wb") as handle:
-        shutil.copyfileobj(response["Body"], handle)
+    """
+    Download an object, splitting large ones into parallel ranged GETs.
+
+    The transfer manager writes to a temporary file and renames it into
+    place, so an existing hardlink at ``destination`` is replaced rather
+    than overwritten.
+    """
+    _download(s3, bucket, key, destination, max_concurrency)
     return destination
 
 
+def _etag_path(destination: Path) -> Path:
+    return destination.with_name(destination.name + ".etag")
+
+
+def _read_etag(destination: Path) -> Optional[str]:
+    try:
+        return _etag_path(destination).read_text().strip() or None
+    except OSError:
+        return None
+
+
 def ensure_object(
     s3: BaseClient,
     *,
@@ -59,13 +199,80 @@ def ensure_object(
     destination: Path,
     project_root: Optional[Path] = None,
     allow_cache: bool = True,
+    on_cache_hit: Optional[Callable[[Path], None]] = None,
+    max_concurrency: int = MAX_TRANSFER_CONCURRENCY,
 ) -> Path:
     """
     Fetch an object from S3, reusing captured copies when present.
+
+    Downloads record the object's ETag in a ``<destination>.etag`` sidecar; a
+    later call whose HeadObject ETag still matches skips the GET and reports
+    the reuse through ``on_cache_hit``.
     """
-    if allow_cache and project_root is not None:
+    if not allow_cache:
+        return download_object(
+            s3, bucket=bucket, key=key, destination=destination, max_concurrency=max_concurrency
+        )
+    if project_root is not None:
         cached = resolve_cached_object(project_root, key)
         if cached:
-            shutil.copyfile(cached, destination)
+            return link_or_copy(cached, destination)
+
+    # Only pay for a HeadObject when a previous download could be reused.
+    recorded_etag = _read_etag(destination) if destination.is_file() else None
+    if recorded_etag is not None:
+        if s3.head_object(Bucket=bucket, Key=key).get("ETag") == recorded_etag:
+            if on_cache_hit:
+                on_cache_hit(destination)
             return destination
-    return download_object(s3, bucket=bucket, key=key, destination=destination)
+    _etag_path(destination).unlink(missing_ok=True)
+    etag = _download(s3, bucket, key, destination, max_concurrency)
+    if etag:
+        try:
+            _etag_path(destination).write_text(etag + "\n")
+        except OSError:
+            pass
+    return destination
+
+
+def ensure_objects(
+    s3: BaseClient,
+    *,
+    bucket: str,
+    destinations: Mapping[str, Path],
+    project_root: Optional[Path] = None,
+    allow_cache: bool = True,
+    max_workers: int = 16,
+) -> List[Path]:
+    """
+    Fetch several objects concurrently; ``destinations`` maps S3 key to path.
+
+    boto3 clients are thread-safe and GetObject releases the GIL while waiting
+    on the network, so a thread pool overlaps the per-request latency. Paths are
+    returned in the mapping's order.
+    """
+    items = list(destinations.items())
+    if not items:
+        return []
+    # Build the capture index up front instead of racing to build it per thread.
+    if allow_cache and project_root is not None:
+        _build_cache_index(project_root)
+    workers = min(max_workers, len(items))
+    # Split the shared client's connection pool between the workers so their
+    # ranged GETs never exceed it.
+    per_transfer = max(1, min(MAX_TRANSFER_CONCURRENCY, MAX_POOL_CONNECTIONS // workers))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(
+            pool.map(
+                lambda item: ensure_object(
+                    s3,
+                    bucket=bucket,
+                    key=item[0],
+                    destination=item[1],
+                    project_root=project_root,
+                    allow_cache=allow_cache,
+                    max_concurrency=per_transfer,
+                ),
+                items,
+            )
+        )
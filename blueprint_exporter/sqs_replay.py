@@ -1,48 +1,61 @@
 from __future__ import annotations
 
-import json
+import itertools
+import math
 import time
 import uuid
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, Iterator, List, Optional, TYPE_CHECKING
-
-try:
-    import boto3  # type: ignore
-except ModuleNotFoundError:  # pragma: no cover - offline mode without boto3
-    boto3 = None  # type: ignore
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from botocore.client import BaseClient  # type: ignore
 else:
     BaseClient = Any  # type: ignore[misc, assignment]
 
+from . import _json
+from .aws import get_client
 from .config import ReplayConfig
 from .payloads import ReportRequest
 
+# DeleteMessageBatch accepts at most ten entries per call.
+_DELETE_BATCH_SIZE = 10
+
+# ReceiveMessage long polls for at most 20 seconds and returns at most ten
+# messages; larger values are rejected.
+MAX_WAIT_TIME_SECONDS = 20
+MAX_RECEIVE_MESSAGES = 10
+
+# FIFO deduplication IDs only need to be unique within SQS's five-minute
+# window, so one random prefix per process plus a counter is enough.
+_DEDUP_PREFIX = uuid.uuid4().hex
+_DEDUP_COUNTER = itertools.count()
+
+
+def _dedup_id() -> str:
+    return f"{_DEDUP_PREFIX}-{next(_DEDUP_COUNTER):016x}"
+
 
 def create_sqs_client(region_name: str) -> BaseClient:
-    if boto3 is None:
-        raise ModuleNotFoundError("boto3 is required for live mode SQS access.")
-    return boto3.client("sqs", region_name=region_name)
+    return get_client("sqs", region_name)
 
 
 def _ensure_string(value: object) -> str:
     if isinstance(value, str):
         return value
-    return json.dumps(value, separators=(",", ":"))
+    return _json.dumps_text(value)
 
 
 def _parse_body(raw_body: str) -> Dict[str, object]:
     try:
-        envelope = json.loads(raw_body)
-    except json.JSONDecodeError:
+        envelope = _json.loads(raw_body)
+    except _json.JSONDecodeError:
         return {}
 
     message = envelope.get("Message")
     if isinstance(message, str):
         try:
-            return json.loads(message)
-        except json.JSONDecodeError:
+            return _json.loads(message)
+        except _json.JSONDecodeError:
             return {"Message": message}
     if isinstance(message, dict):
         return message
@@ -52,7 +65,15 @@ def _parse_body(raw_body: str) -> Dict[str, object]:
 @dataclass
 class ReceivedNotification:
     raw: Dict[str, object]
-    body: Dict[str, object]
+    _body: Optional[Dict[str, object]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def body(self) -> Dict[str, object]:
+        # Decoded on first access so notifications that are only deleted or
+        # skipped never pay for the double JSON parse.
+        if self._body is None:
+            self._body = _parse_body(_ensure_string(self.raw.get("Body")))
+        return self._body
 
     @property
     def report_name(self) -> Optional[str]:
@@ -83,7 +104,7 @@ class SQSReplayClient:
         dry_run: bool = False,
     ) -> Dict[str, object]:
         group_id = message_group_id or self._config.message_group_id
-        dedup_id = message_deduplication_id or str(uuid.uuid4())
+        dedup_id = message_deduplication_id or _dedup_id()
         if dry_run:
             return {
                 "QueueUrl": self._config.request_queue_url,
@@ -109,13 +130,21 @@ class SQSReplayClient:
         max_messages: int = 5,
         visibility_timeout: Optional[int] = None,
         stop_after: Optional[int] = None,
+        deadline: Optional[float] = None,
         on_wait: Optional[Callable[[int], None]] = None,
     ) -> Iterator[ReceivedNotification]:
+        """
+        Long-poll the notification queue, yielding messages as they arrive.
+
+        Stops after ``stop_after`` messages or once the ``time.time()`` based
+        ``deadline`` passes; otherwise polls until the caller stops iterating.
+        """
         received = 0
         attempts = 0
+        wait_seconds = max(0, min(wait_time_seconds, MAX_WAIT_TIME_SECONDS))
         params: Dict[str, object] = {
             "QueueUrl": self._config.notification_queue_url,
-            "WaitTimeSeconds": wait_time_seconds,
+            "WaitTimeSeconds": wait_seconds,
             "MaxNumberOfMessages": max_messages,
             "AttributeNames": ["All"],
             "MessageAttributeNames": ["All"],
@@ -123,11 +152,20 @@ class SQSReplayClient:
         if visibility_timeout is not None:
             params["VisibilityTimeout"] = visibility_timeout
 
+        # Bind the client method once; this loop can spin for minutes.
+        receive_message = self._sqs.receive_message
+
         while True:
             if stop_after is not None and received >= stop_after:
                 return
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return
+                # Let the server-side wait end with the deadline, not after it.
+                params["WaitTimeSeconds"] = min(wait_seconds, math.ceil(remaining))
 
-            response = self._sqs.receive_message(**params)
+            response = receive_message(**params)
             messages: List[Dict[str, object]] = response.get("Messages", [])  # type: ignore[assignment]
             if not messages:
                 attempts += 1
@@ -135,10 +173,9 @@ class SQSReplayClient:
                     on_wait(attempts)
                 continue
 
+            received += len(messages)
             for raw in messages:
-                body = _parse_body(_ensure_string(raw.get("Body")))
-                received += 1
-                yield ReceivedNotification(raw=raw, body=body)
+                yield ReceivedNotification(raw=raw)
 
     def delete_notification(self, notification: ReceivedNotification) -> None:
         self._sqs.delete_message(
@@ -146,6 +183,46 @@ class SQSReplayClient:
             ReceiptHandle=notification.receipt_handle,
         )
 
+    def delete_notifications(self, notifications: Iterable[ReceivedNotification]) -> None:
+        """
+        Delete notifications with DeleteMessageBatch, ten per request.
+        """
+        failed = self._delete_batches(notifications)
+        if failed:
+            raise RuntimeError(f"Failed to delete {len(failed)} notification(s): {failed}")
+
+    def _delete_batches(
+        self, notifications: Iterable[ReceivedNotification]
+    ) -> List[Dict[str, object]]:
+        pending = list(notifications)
+        failed: List[Dict[str, object]] = []
+        for start in range(0, len(pending), _DELETE_BATCH_SIZE):
+            chunk = pending[start : start + _DELETE_BATCH_SIZE]
+            response = self._sqs.delete_message_batch(
+                QueueUrl=self._config.notification_queue_url,
+                Entries=[
+                    {"Id": str(index), "ReceiptHandle": notification.receipt_handle}
+                    for index, notification in enumerate(chunk)
+                ],
+            )
+            failed.extend(response.get("Failed", []))  # type: ignore[arg-type]
+        return failed
+
+    def _discard(
+        self,
+        discarded: List[ReceivedNotification],
+        failures: List[Dict[str, object]],
+    ) -> None:
+        # Best effort: an undeleted unrelated message simply becomes visible
+        # again, which must never cost us the result we are waiting for.
+        if not discarded:
+            return
+        try:
+            failures.extend(self._delete_batches(discarded))
+        except Exception as exc:
+            failures.append({"Code": type(exc).__name__, "Message": str(exc)})
+        discarded.clear()
+
     def wait_for_result(
         self,
         *,
@@ -155,7 +232,17 @@ class SQSReplayClient:
         timeout_seconds: int = 300,
         on_wait: Optional[Callable[[float, int], None]] = None,
         on_unexpected: Optional[Callable[[ReceivedNotification], None]] = None,
+        discard_unexpected: bool = False,
+        on_discard_failed: Optional[Callable[[List[Dict[str, object]]], None]] = None,
     ) -> Optional[ReceivedNotification]:
+        """
+        Wait for the notification for ``expected_report``.
+
+        Unrelated notifications are reported to ``on_unexpected`` and left on the
+        queue, unless ``discard_unexpected`` is set, in which case they are
+        deleted in DeleteMessageBatch calls. Those deletes are flushed before
+        returning; failures go to ``on_discard_failed`` rather than being raised.
+        """
         deadline = time.time() + timeout_seconds
 
         def handle_wait(attempts: int) -> None:
@@ -164,19 +251,34 @@ class SQSReplayClient:
             remaining = max(0.0, deadline - time.time())
             on_wait(remaining, attempts)
 
-        while time.time() < deadline:
-            iterator = self.poll_notifications(
-                wait_time_seconds=poll_interval,
-                max_messages=5,
-                visibility_timeout=visibility_timeout,
-                stop_after=1,
-                on_wait=handle_wait,
-            )
+        # Each ReceiveMessage blocks server-side until a message arrives or the
+        # long-poll window ends, so no client-side sleeping is needed.
+        iterator = self.poll_notifications(
+            wait_time_seconds=poll_interval,
+            max_messages=MAX_RECEIVE_MESSAGES,
+            visibility_timeout=visibility_timeout,
+            deadline=deadline,
+            on_wait=handle_wait,
+        )
+        discarded: List[ReceivedNotification] = []
+        failures: List[Dict[str, object]] = []
+        match: Optional[ReceivedNotification] = None
+        try:
             for notification in iterator:
                 if expected_report and notification.report_name != expected_report:
-                    # Leave the message on the queue for another consumer.
                     if on_unexpected:
                         on_unexpected(notification)
+                    if discard_unexpected:
+                        discarded.append(notification)
+                        if len(discarded) >= _DELETE_BATCH_SIZE:
+                            self._discard(discarded, failures)
+                    # Otherwise leave the message on the queue for another consumer.
                     continue
-                return notification
-        return None
+                match = notification
+                break
+        finally:
+            # _discard never raises, so it cannot mask the match or an error.
+            self._discard(discarded, failures)
+        if failures and on_discard_failed:
+            on_discard_failed(failures)
+        return match
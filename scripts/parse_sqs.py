@@ -16,32 +16,94 @@ The script understands the Blueprint OMS messaging format:
 from __future__ import annotations
 
 import argparse
-import html
-import json
+import mmap
 import re
+import sys
 import urllib.parse
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
-SEND_PATTERN = re.compile(r"^Action=SendMessage")
-BODY_PATTERN = re.compile(r"<Body>(.*?)</Body>")
+from blueprint_exporter import _json
+
+
+SEND_PATTERN = re.compile(
+    rb"^Action=SendMessage[^\r\n]*?&MessageBody=([^&\r\n]*)",
+    re.MULTILINE,
+)
+# Body text is XML-escaped, so it never contains a literal "<". The negated
+# class lets the scan run without the backtracking a lazy ".*?" needs.
+BODY_PATTERN = re.compile(rb"<Body>([^<\n]*)</Body>")
+
+
+# The XML predefined entities; "amp" must stay last so that "&amp;lt;" decodes
+# to the literal text "&lt;".
+_XML_ENTITIES = {
+    b"quot": b'"',
+    b"apos": b"'",
+    b"lt": b"<",
+    b"gt": b">",
+    b"amp": b"&",
+}
+_XML_REFERENCE = re.compile(rb"&(quot|apos|lt|gt|amp|#[0-9]+|#[xX][0-9a-fA-F]+);")
+
+
+def _replace_reference(match: "re.Match[bytes]") -> bytes:
+    name = match.group(1)
+    if not name.startswith(b"#"):
+        return _XML_ENTITIES[name]
+    code = int(name[2:], 16) if name[1:2] in (b"x", b"X") else int(name[1:])
+    try:
+        return chr(code).encode("utf-8")
+    except (ValueError, OverflowError):
+        return "\ufffd".encode("utf-8")
+
+
+def _xml_unescape(value: bytes) -> bytes:
+    if b"&#" in value:
+        # Character references are rare; resolve everything in one regex pass.
+        return _XML_REFERENCE.sub(_replace_reference, value)
+    for name, char in _XML_ENTITIES.items():
+        value = value.replace(b"&" + name + b";", char)
+    return value
+
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+def _decode_message_body(value: bytes) -> bytes:
+    # The client form-encodes an already percent-encoded payload, so undo both
+    # layers (the first one with parse_qs' "+" handling).
+    form_decoded = urllib.parse.unquote_to_bytes(value.replace(b"+", b" "))
+    return urllib.parse.unquote_to_bytes(form_decoded)
 
 
 def parse(args: argparse.Namespace) -> Dict[str, Any]:
-    raw = Path(args.input).read_text()
+    # Map the transcript instead of reading it: the regexes scan the mapping
+    # directly, so memory use tracks the matches rather than the file size.
+    with open(args.input, "rb") as handle:
+        try:
+            raw = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Zero-length files cannot be mapped.
+            return _summarise(b"")
+        with raw:
+            return _summarise(raw)
+
+
+def _summarise(raw: Buffer) -> Dict[str, Any]:
     requests: List[Dict[str, Any]] = []
     responses: List[Dict[str, Any]] = []
     s3_pointers: List[Dict[str, Any]] = []
     notifications: List[Dict[str, Any]] = []
 
-    for line in raw.splitlines():
-        if not SEND_PATTERN.match(line):
-            continue
-        qs = urllib.parse.parse_qs(line)
-        encoded_body = urllib.parse.unquote(qs["MessageBody"][0])
-        outer = json.loads(encoded_body)
-        message = json.loads(outer["Message"])
+    for match in SEND_PATTERN.finditer(raw):
+        outer = _json.loads(_decode_message_body(match.group(1)))
+        message = _json.loads(outer["Message"])
         requests.append(
             {
                 "type": "request",
@@ -51,10 +113,9 @@ def parse(args: argparse.Namespace) -> Dict[str, Any]:
         )
 
     for match in BODY_PATTERN.finditer(raw):
-        decoded = html.unescape(match.group(1))
         try:
-            body = json.loads(decoded)
-        except json.JSONDecodeError:
+            body = _json.loads(_xml_unescape(match.group(1)))
+        except (_json.JSONDecodeError, UnicodeDecodeError):
             continue
 
         if isinstance(body, list):
@@ -66,7 +127,7 @@ def parse(args: argparse.Namespace) -> Dict[str, Any]:
             continue
 
         raw_message = body["Message"]
-        message = json.loads(raw_message) if isinstance(raw_message, str) else raw_message
+        message = _json.loads(raw_message) if isinstance(raw_message, str) else raw_message
 
         if isinstance(message, dict) and "reportResultXml" in message:
             responses.append({"type": "response", "message": message})
@@ -92,7 +153,7 @@ def main() -> None:
     args = parser.parse_args()
 
     summary = parse(args)
-    Path(args.output).write_text(json.dumps(summary, indent=2))
+    Path(args.output).write_bytes(_json.dumps(summary, indent=True))
 
 
 if __name__ == "__main__":
@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 import argparse
-import json
+import functools
+import hashlib
+import pickle
 import sys
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Callable, Iterable, Optional, Sequence, TypeVar
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from blueprint_exporter import _json
 from blueprint_exporter.catalog import load_catalog, iter_names
 from blueprint_exporter.config import ReplayConfig
 from blueprint_exporter.jasper import decompress_jasperprint, export_with_jasperstarter
@@ -21,7 +24,11 @@ from blueprint_exporter.payloads import (
     ReportRequest,
     load_processed_messages,
 )
-from blueprint_exporter.s3_download import create_s3_client, ensure_object
+from blueprint_exporter.s3_download import (
+    create_s3_client,
+    ensure_object,
+    link_or_copy,
+)
 from blueprint_exporter.sqs_replay import SQSReplayClient, create_sqs_client
 
 
@@ -33,8 +40,24 @@ DEFAULT_CONFIG = ReplayConfig(
     processed_messages_path=Path("captures/merged_report_messages.json"),
 )
 
+_Loaded = TypeVar("_Loaded")
+
+
+@functools.lru_cache(maxsize=None)
+def cache_format() -> str:
+    """
+    Digest of the modules that define the pickled classes and their loaders.
+
+    Any edit to payloads.py or catalog.py invalidates existing caches, so a
+    changed dataclass or parser never unpickles a stale shape.
+    """
+    digest = hashlib.sha256()
+    for module_name in (load_processed_messages.__module__, load_catalog.__module__):
+        digest.update(Path(sys.modules[module_name].__file__).read_bytes())
+    return digest.hexdigest()
 
-def parse_args() -> argparse.Namespace:
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Replay captured Blueprint OMS report requests and export the resulting JasperPrint payloads.",
     )
@@ -74,13 +97,18 @@ def parse_args() -> argparse.Namespace:
         "--poll-wait",
         type=int,
         default=20,
-        help="WaitTimeSeconds parameter passed to ReceiveMessage.",
+        help="WaitTimeSeconds parameter passed to ReceiveMessage (SQS caps this at 20).",
     )
     parser.add_argument(
         "--keep-message",
         action="store_true",
         help="Do not delete the notification message after downloading the result.",
     )
+    parser.add_argument(
+        "--discard-unrelated",
+        action="store_true",
+        help="Delete notifications for other reports instead of leaving them on the queue.",
+    )
     parser.add_argument(
         "--decompress",
         action="store_true",
@@ -104,7 +132,7 @@ def parse_args() -> argparse.Namespace:
         "--period-end",
         help="Override the report's periodEnd parameter (YYYY-MM-DD).",
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def ensure_output_dir(path: str) -> Path:
@@ -113,8 +141,54 @@ def ensure_output_dir(path: str) -> Path:
     return output_dir
 
 
+def load_with_cache(
+    path: Path,
+    loader: Callable[[Path], _Loaded],
+    cache_path: Path,
+) -> _Loaded:
+    """
+    Load ``path`` via a pickle of the parsed result when it is still fresh.
+
+    The pickle records the cache format and the source's mtime and size; any
+    mismatch or unreadable cache falls back to ``loader`` and rewrites it.
+    """
+    stat = path.stat()
+    stamp = (cache_format(), stat.st_mtime_ns, stat.st_size)
+    try:
+        with cache_path.open("rb") as handle:
+            cached_stamp, value = pickle.load(handle)
+        if cached_stamp == stamp:
+            return value
+    except Exception:
+        pass
+
+    value = loader(path)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with cache_path.open("wb") as handle:
+            pickle.dump((stamp, value), handle, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return value
+
+
+def cache_path_for(root: Path, path: Path) -> Path:
+    return root / "captures" / ".cache" / f"{path.name}.pkl"
+
+
+@functools.lru_cache(maxsize=None)
+def load_messages(path: Path) -> ReportMessages:
+    """Parse the processed messages capture once per process."""
+    root = Path(__file__).resolve().parent.parent
+    return load_with_cache(path, load_processed_messages, cache_path_for(root, path))
+
+
+def format_json(obj: object) -> str:
+    return _json.dumps(obj, indent=True).decode("utf-8")
+
+
 def print_json(obj: object) -> None:
-    print(json.dumps(obj, indent=2))
+    print(format_json(obj))
 
 
 def apply_period_overrides(
@@ -125,7 +199,7 @@ def apply_period_overrides(
     if not period_start and not period_end:
         return request
 
-    message = json.loads(request.message_json())
+    message = _json.loads(request.message_json())
     parameters = message.setdefault("parameterMap", {})
     if period_start:
         parameters["periodStart"] = period_start
@@ -146,7 +220,7 @@ def offline_flow(
     decompress: bool,
     jasperstarter: Optional[Path],
     export_formats: Optional[Iterable[str]],
-) -> None:
+) -> Optional[Path]:
     request = messages.request_by_name(report_name)
     response = messages.response_by_name(report_name)
     result_key = response.result_key
@@ -156,18 +230,19 @@ def offline_flow(
     print("Replaying offline request payload:")
     print_json(request.envelope())
 
-    download_path = output_dir / f"{result_key}.gz"
     cached = root / "captures" / "2025-10-20" / "s3" / result_key
     if not cached.exists():
         raise SystemExit(f"Captured artefact {cached} is missing.")
-    download_path.write_bytes(cached.read_bytes())
-    print(f"Copied captured artefact to {download_path}")
 
     jrprint_path: Optional[Path] = None
     if decompress:
         jrprint_path = output_dir / f"{result_key}.jrprint"
-        decompress_jasperprint(download_path, jrprint_path)
-        print(f"Decompressed JasperPrint to {jrprint_path}")
+        decompress_jasperprint(cached, jrprint_path)
+        print(f"Decompressed captured artefact to {jrprint_path}")
+    else:
+        download_path = output_dir / f"{result_key}.gz"
+        link_or_copy(cached, download_path)
+        print(f"Copied captured artefact to {download_path}")
 
     if jasperstarter and jrprint_path and export_formats:
         export_with_jasperstarter(
@@ -177,6 +252,7 @@ def offline_flow(
             output_dir=output_dir,
         )
         print(f"Exported JasperPrint via jasperstarter to {output_dir}")
+    return jrprint_path
 
 
 def live_flow(
@@ -189,12 +265,13 @@ def live_flow(
     poll_timeout: int,
     poll_wait: int,
     keep_message: bool,
+    discard_unrelated: bool,
     decompress: bool,
     jasperstarter: Optional[Path],
     export_formats: Optional[Iterable[str]],
     period_start: Optional[str],
     period_end: Optional[str],
-) -> None:
+) -> Optional[Path]:
     base_request = messages.request_by_name(report_name)
     request = apply_period_overrides(base_request, period_start, period_end)
     expected_report_name = base_request.report_name or report_name
@@ -206,7 +283,7 @@ def live_flow(
     if dry_run:
         print("Dry-run SendMessage payload:")
         print_json(send_response)
-        return
+        return None
 
     print(
         f"Waiting for report result (timeout {poll_timeout}s, polling every {poll_wait}s)...",
@@ -227,7 +304,7 @@ def live_flow(
     def log_unexpected(notification):
         print(
             "  Received unrelated notification:",
-            json.dumps(notification.body, indent=2),
+            format_json(notification.body),
             sep="\n",
             flush=True,
         )
@@ -238,6 +315,12 @@ def live_flow(
         timeout_seconds=poll_timeout,
         on_wait=log_wait,
         on_unexpected=log_unexpected,
+        discard_unexpected=discard_unrelated and not keep_message,
+        on_discard_failed=lambda failed: print(
+            f"  Warning: could not delete {len(failed)} unrelated notification(s): {failed}",
+            file=sys.stderr,
+            flush=True,
+        ),
     )
     if not notification:
         raise SystemExit("Timed out waiting for report response.")
@@ -258,9 +341,12 @@ def live_flow(
         destination=download_path,
         project_root=root,
         allow_cache=True,
+        on_cache_hit=lambda path: print(f"ETag unchanged; reusing {path}"),
     )
     print(f"Report artefact saved to {download_path}")
 
+    # Acknowledge as soon as the artefact is on disk; inflating and exporting
+    # happen afterwards so they cannot outlast the visibility timeout.
     if not keep_message:
         replay_client.delete_notification(notification)
         print("Deleted notification message from queue.")
@@ -279,58 +365,58 @@ def live_flow(
             output_dir=output_dir,
         )
         print(f"Exported JasperPrint via jasperstarter to {output_dir}")
+    return jrprint_path
 
 
-def main() -> None:
-    args = parse_args()
+def main(argv: Optional[Sequence[str]] = None) -> Optional[Path]:
+    """Run one replay; returns the decompressed .jrprint path, if any."""
+    args = parse_args(argv)
     root = Path(__file__).resolve().parent.parent
     output_dir = ensure_output_dir(args.output_dir)
     export_formats = args.export_format if args.export_format else None
-    messages = load_processed_messages(DEFAULT_CONFIG.resolve_messages_path(root))
+    messages = load_messages(DEFAULT_CONFIG.resolve_messages_path(root))
 
     if args.list_reports:
-        catalog_key = None
-        for pointer in messages.s3_pointers:
-            if pointer.get("s3BucketName") == DEFAULT_CONFIG.bucket_name:
-                catalog_key = pointer.get("s3Key")
-                break
+        catalog_key = messages.s3_key_for_bucket(DEFAULT_CONFIG.bucket_name)
         if not catalog_key:
             raise SystemExit("No catalog pointer found in processed messages.")
         catalog_path = root / "captures" / "2025-10-20" / "s3" / catalog_key
         if not catalog_path.exists():
             raise SystemExit(f"Catalog artefact missing: {catalog_path}")
-        entries = load_catalog(catalog_path)
+        entries = load_with_cache(
+            catalog_path, load_catalog, cache_path_for(root, catalog_path)
+        )
         for entry in entries:
             status = "(inactive)" if not entry.active else ""
             print(f"{entry.description} [{entry.category}] {status}".strip())
-        return
+        return None
 
     if args.mode == "offline":
-        offline_flow(
-            root=root,
-            output_dir=output_dir,
-            messages=messages,
-            report_name=args.report_name,
-            decompress=args.decompress,
-            jasperstarter=args.jasperstarter,
-            export_formats=export_formats,
-        )
-    else:
-        live_flow(
+        return offline_flow(
             root=root,
             output_dir=output_dir,
             messages=messages,
             report_name=args.report_name,
-            dry_run=args.dry_run,
-            poll_timeout=args.poll_timeout,
-            poll_wait=args.poll_wait,
-            keep_message=args.keep_message,
             decompress=args.decompress,
             jasperstarter=args.jasperstarter,
             export_formats=export_formats,
-            period_start=args.period_start,
-            period_end=args.period_end,
         )
+    return live_flow(
+        root=root,
+        output_dir=output_dir,
+        messages=messages,
+        report_name=args.report_name,
+        dry_run=args.dry_run,
+        poll_timeout=args.poll_timeout,
+        poll_wait=args.poll_wait,
+        keep_message=args.keep_message,
+        discard_unrelated=args.discard_unrelated,
+        decompress=args.decompress,
+        jasperstarter=args.jasperstarter,
+        export_formats=export_formats,
+        period_start=args.period_start,
+        period_end=args.period_end,
+    )
 
 
 if __name__ == "__main__":
@@ -1,23 +1,33 @@
 #!/usr/bin/env python3
 """
 End-to-end helper that:
-  1. Replays a report via scripts/replay_reports.py (live or offline).
-  2. Converts the resulting JRPrint to CSV using ReportExporter.
+  1. Replays one or more reports via scripts/replay_reports.py (live or offline).
+  2. Converts the resulting JRPrints to CSV in one ReportExporter run.
   3. Uploads the CSV to Convex via scripts/ingest_report.js.
 
 Example:
   python scripts/run_report_pipeline.py --report-name "Referral Source - Appointments"
+
+When the Nailgun client (`ng`) is on PATH and a nailgun-server jar is available
+(NAILGUN_SERVER_JAR or ./nailgun-server.jar), ReportExporter runs inside a
+long-lived Nailgun JVM instead of a fresh `java` process per CSV. The server
+keeps running on 127.0.0.1:2113 after the pipeline exits. Nailgun has no
+authentication, so every local user can run code in that JVM; do not enable it
+on shared machines.
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import re
 import shutil
+import socket
 import subprocess
 import sys
+import tempfile
 import time
 from datetime import date, datetime, timedelta
 from pathlib import Path
@@ -29,9 +39,26 @@ JAVA_BIN = JAVA_HOME / "bin" / "java"
 JAVAC_BIN = JAVA_HOME / "bin" / "javac"
 REPORT_EXPORTER_JAVA = PROJECT_ROOT / "ReportExporter.java"
 REPORT_EXPORTER_CLASS = PROJECT_ROOT / "ReportExporter.class"
+# Hash of the ReportExporter.java that produced ReportExporter.class.
+REPORT_EXPORTER_HASH = PROJECT_ROOT / "ReportExporter.class.sha256"
 CLIENT_CLASSPATH_FILE = PROJECT_ROOT / "client_classpath.txt"
-REPLAY_SCRIPT = PROJECT_ROOT / "scripts" / "replay_reports.py"
 INGEST_SCRIPT = PROJECT_ROOT / "scripts" / "ingest_report.js"
+NAILGUN_SERVER_JAR = Path(
+    os.environ.get("NAILGUN_SERVER_JAR", PROJECT_ROOT / "nailgun-server.jar")
+)
+NAILGUN_SERVER_CLASS = "com.facebook.nailgun.NGServer"
+NAILGUN_HOST = "127.0.0.1"
+NAILGUN_PORT = 2113
+NAILGUN_START_TIMEOUT = 30.0
+# Describes whichever server currently owns the port, whatever checkout started it.
+NAILGUN_STAMP = Path(tempfile.gettempdir()) / f"blueprint-nailgun-{NAILGUN_PORT}.stamp"
+_SOURCE_KEY_TS = re.compile(r"(\d{10,})$")
+
+SCRIPT_DIR = PROJECT_ROOT / "scripts"
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+import replay_reports  # noqa: E402  (needs SCRIPT_DIR on sys.path)
 
 REPORT_TARGET_TABLES: dict[str, str] = {
     "Referral Source - Appointments": "appointments",
@@ -72,15 +99,102 @@ def run_command(
     return completed
 
 
+def exporter_classpath() -> str:
+    cp_text = CLIENT_CLASSPATH_FILE.read_text().strip()
+    return f".:{cp_text}" if cp_text else "."
+
+
+def nailgun_client() -> str | None:
+    ng = shutil.which("ng")
+    if ng and NAILGUN_SERVER_JAR.is_file():
+        return ng
+    return None
+
+
+def nailgun_running() -> bool:
+    try:
+        with socket.create_connection((NAILGUN_HOST, NAILGUN_PORT), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+def nailgun_stamp() -> str:
+    """Identify the classes a server would load: checkout, class bytes and classpath."""
+    digest = hashlib.sha256()
+    for part in (str(PROJECT_ROOT), exporter_classpath(), str(NAILGUN_SERVER_JAR)):
+        digest.update(part.encode("utf-8") + b"\0")
+    digest.update(REPORT_EXPORTER_CLASS.read_bytes())
+    return digest.hexdigest()
+
+
+def stop_nailgun_server(ng: str) -> None:
+    NAILGUN_STAMP.unlink(missing_ok=True)
+    if not nailgun_running():
+        return
+    print("Stopping Nailgun server started with a different ReportExporter or classpath...")
+    subprocess.run(
+        [ng, "--nailgun-port", str(NAILGUN_PORT), "ng-stop"],
+        check=False,
+        cwd=PROJECT_ROOT,
+    )
+    deadline = time.monotonic() + NAILGUN_START_TIMEOUT
+    while nailgun_running() and time.monotonic() < deadline:
+        time.sleep(0.1)
+    if nailgun_running():
+        raise SystemExit(
+            f"Port {NAILGUN_PORT} is still in use; stop that process or unset NAILGUN_SERVER_JAR."
+        )
+
+
+def ensure_nailgun_server(ng: str) -> None:
+    stamp = nailgun_stamp()
+    if nailgun_running():
+        try:
+            current = NAILGUN_STAMP.read_text().strip()
+        except OSError:
+            current = ""
+        if current == stamp:
+            return
+        stop_nailgun_server(ng)
+    print(f"Starting Nailgun server on {NAILGUN_HOST}:{NAILGUN_PORT}...")
+    cmd = arch_prefix() + [
+        str(JAVA_BIN),
+        "-cp",
+        f"{exporter_classpath()}:{NAILGUN_SERVER_JAR}",
+        NAILGUN_SERVER_CLASS,
+        f"{NAILGUN_HOST}:{NAILGUN_PORT}",
+    ]
+    # Left running after the pipeline exits so later runs skip JVM start-up.
+    subprocess.Popen(
+        cmd,
+        cwd=PROJECT_ROOT,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + NAILGUN_START_TIMEOUT
+    while not nailgun_running():
+        if time.monotonic() >= deadline:
+            raise SystemExit("Nailgun server did not start; unset NAILGUN_SERVER_JAR to use java.")
+        time.sleep(0.1)
+    NAILGUN_STAMP.write_text(stamp + "\n")
+
+
 def ensure_report_exporter_compiled() -> None:
     if not CLIENT_CLASSPATH_FILE.exists():
         raise SystemExit("client_classpath.txt not found; cannot compile ReportExporter.")
-    cp_text = CLIENT_CLASSPATH_FILE.read_text().strip()
-    classpath = f".:{cp_text}" if cp_text else "."
-    needs_compile = (
-        not REPORT_EXPORTER_CLASS.exists()
-        or REPORT_EXPORTER_CLASS.stat().st_mtime < REPORT_EXPORTER_JAVA.stat().st_mtime
-    )
+    classpath = exporter_classpath()
+    # The class is a build product (not tracked), so trust it only when its
+    # sidecar records the hash of the current source; mtimes are unreliable
+    # after clones, checkouts and cache restores.
+    source_hash = hashlib.sha256(REPORT_EXPORTER_JAVA.read_bytes()).hexdigest()
+    try:
+        recorded_hash = REPORT_EXPORTER_HASH.read_text().strip()
+    except OSError:
+        recorded_hash = ""
+    needs_compile = not REPORT_EXPORTER_CLASS.exists() or recorded_hash != source_hash
     if needs_compile:
         print("Compiling ReportExporter.java...")
         cmd = arch_prefix() + [
@@ -90,6 +204,7 @@ def ensure_report_exporter_compiled() -> None:
             str(REPORT_EXPORTER_JAVA),
         ]
         run_command(cmd, cwd=PROJECT_ROOT)
+        REPORT_EXPORTER_HASH.write_text(source_hash + "\n")
 
 
 def replay_report(
@@ -99,10 +214,10 @@ def replay_report(
     period_start: str,
     period_end: str,
     extra_args: list[str],
-) -> None:
-    cmd = [
-        sys.executable,
-        str(REPLAY_SCRIPT),
+) -> Path | None:
+    # Run replay_reports in-process so boto3 and the parsed message capture are
+    # loaded once per pipeline run rather than once per chunk.
+    argv = [
         "--report-name",
         report_name,
         "--mode",
@@ -112,37 +227,46 @@ def replay_report(
         "--decompress",
     ] + extra_args
     if period_start:
-        cmd.extend(["--period-start", period_start])
+        argv.extend(["--period-start", period_start])
     if period_end:
-        cmd.extend(["--period-end", period_end])
-    run_command(cmd, cwd=PROJECT_ROOT)
+        argv.extend(["--period-end", period_end])
+    print(f"\n$ replay_reports.py {' '.join(argv)}", flush=True)
+    return replay_reports.main(argv)
 
 
 def latest_jrprint(output_dir: Path, seen: set[Path] | None = None) -> Path:
-    jrprints = sorted(output_dir.glob("*.jrprint"), key=lambda p: p.stat().st_mtime, reverse=True)
-    if seen:
-        jrprints = [path for path in jrprints if path not in seen]
-    if not jrprints:
+    seen = seen or set()
+    latest = max(
+        (path for path in output_dir.glob("*.jrprint") if path not in seen),
+        key=lambda path: path.stat().st_mtime,
+        default=None,
+    )
+    if latest is None:
         raise SystemExit(f"No .jrprint files found in {output_dir}. Did replay succeed?")
-    return jrprints[0]
+    return latest
 
 
-def convert_to_csv(jrprint_path: Path) -> Path:
+def convert_to_csv(jrprint_paths: list[Path]) -> list[Path]:
+    """Convert every JRPrint to a sibling CSV in a single ReportExporter run."""
     ensure_report_exporter_compiled()
-    cp_text = CLIENT_CLASSPATH_FILE.read_text().strip()
-    classpath = f".:{cp_text}" if cp_text else "."
-    csv_path = jrprint_path.with_suffix(".csv")
-    cmd = arch_prefix() + [
-        str(JAVA_BIN),
-        "-cp",
-        classpath,
-        "ReportExporter",
-        str(jrprint_path),
-        "csv",
-        str(csv_path),
-    ]
-    run_command(cmd, cwd=PROJECT_ROOT)
-    return csv_path
+    csv_paths = [path.with_suffix(".csv") for path in jrprint_paths]
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", suffix=".tsv", prefix="report-manifest-", delete=False
+    ) as manifest:
+        for jrprint_path, csv_path in zip(jrprint_paths, csv_paths):
+            manifest.write(f"{jrprint_path.resolve()}\t{csv_path.resolve()}\n")
+    try:
+        exporter_args = ["ReportExporter", "--manifest", manifest.name, "csv"]
+        ng = nailgun_client()
+        if ng:
+            ensure_nailgun_server(ng)
+            cmd = [ng, "--nailgun-port", str(NAILGUN_PORT)] + exporter_args
+        else:
+            cmd = arch_prefix() + [str(JAVA_BIN), "-cp", exporter_classpath()] + exporter_args
+        run_command(cmd, cwd=PROJECT_ROOT)
+    finally:
+        os.unlink(manifest.name)
+    return csv_paths
 
 
 def ensure_aws_credentials() -> None:
@@ -171,7 +295,7 @@ def ensure_aws_credentials() -> None:
 
 
 def infer_captured_at(source_key: str) -> int:
-    match = re.search(r"(\d{10,})$", source_key)
+    match = _SOURCE_KEY_TS.search(source_key)
     if match:
         try:
             return int(match.group(1))
@@ -237,12 +361,17 @@ def ingest_csv(
         "--table",
         target_table,
     ]
-    run_command(cmd, cwd=PROJECT_ROOT, env=os.environ.copy())
+    run_command(cmd, cwd=PROJECT_ROOT)
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Replay, export, and ingest a report end-to-end.")
-    parser.add_argument("--report-name", required=True, help="Report name to request.")
+    parser.add_argument(
+        "--report-name",
+        action="append",
+        required=True,
+        help="Report name to request. Repeat to run several reports in one pipeline.",
+    )
     parser.add_argument(
         "--mode",
         choices=["live", "offline"],
@@ -285,7 +414,7 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--table",
-        help="Override the target table for ingestion (otherwise derived from report name).",
+        help="Override the target table for ingestion (otherwise derived from report name). Applies to every report.",
     )
     return parser.parse_args()
 
@@ -302,10 +431,6 @@ def main() -> None:
         args.end_date,
     )
 
-    print(
-        f"Requesting '{args.report_name}' for period {period_start} → {period_end}"
-    )
-
     extra_args: list[str] = []
     if args.replay_args:
         try:
@@ -316,6 +441,16 @@ def main() -> None:
         except ValueError as exc:
             raise SystemExit(f"--replay-args must be a JSON array of strings: {exc}")
 
+    report_names = list(dict.fromkeys(args.report_name))
+    target_tables: dict[str, str] = {}
+    for report_name in report_names:
+        target_table = args.table or REPORT_TARGET_TABLES.get(report_name)
+        if not target_table:
+            raise SystemExit(
+                f"No target table configured for report '{report_name}'. Use --table to specify one."
+            )
+        target_tables[report_name] = target_table
+
     start_date = parse_date_value(period_start)
     end_date = parse_date_value(period_end)
 
@@ -325,56 +460,67 @@ def main() -> None:
         chunks = [(start_date, end_date)]
 
     existing_jrprints = set(output_dir.glob("*.jrprint"))
-    chunk_records: list[tuple[Path, str, int]] = []
     chunk_count = len(chunks)
-
-    for index, (chunk_start, chunk_end) in enumerate(chunks, 1):
-        chunk_start_str = format_date_value(chunk_start)
-        chunk_end_str = format_date_value(chunk_end)
-        print(f"\n=== Chunk {index}/{chunk_count}: {chunk_start_str} → {chunk_end_str} ===")
-        replay_report(
-            args.report_name,
-            args.mode,
-            output_dir,
-            chunk_start_str,
-            chunk_end_str,
-            extra_args,
-        )
-
-        jrprint = latest_jrprint(output_dir, existing_jrprints)
-        existing_jrprints.add(jrprint)
-        source_key = jrprint.stem
-        captured_at = args.captured_at or infer_captured_at(source_key)
-
-        print(f"Chunk {index}: Latest JRPrint → {jrprint}")
-        csv_path = convert_to_csv(jrprint)
-        print(f"Chunk {index}: Generated CSV → {csv_path}")
-
-        chunk_records.append((csv_path, source_key, captured_at))
-
-    if not chunk_records:
+    # (report name, jrprint, source key, capturedAt) for every replayed chunk.
+    replayed: list[tuple[str, Path, str, int]] = []
+
+    for report_name in report_names:
+        print(f"Requesting '{report_name}' for period {period_start} → {period_end}")
+        for index, (chunk_start, chunk_end) in enumerate(chunks, 1):
+            chunk_start_str = format_date_value(chunk_start)
+            chunk_end_str = format_date_value(chunk_end)
+            print(f"\n=== Chunk {index}/{chunk_count}: {chunk_start_str} → {chunk_end_str} ===")
+            jrprint = replay_report(
+                report_name,
+                args.mode,
+                output_dir,
+                chunk_start_str,
+                chunk_end_str,
+                extra_args,
+            )
+            if jrprint is None:
+                jrprint = latest_jrprint(output_dir, existing_jrprints)
+            elif jrprint in existing_jrprints:
+                # Offline chunks and stale notifications resolve to the same
+                # result key; never convert or ingest one artefact twice.
+                raise SystemExit(
+                    f"Replay returned {jrprint}, which was already present. Did replay succeed?"
+                )
+            existing_jrprints.add(jrprint)
+            source_key = jrprint.stem
+            captured_at = args.captured_at or infer_captured_at(source_key)
+
+            print(f"Chunk {index}: Latest JRPrint → {jrprint}")
+            replayed.append((report_name, jrprint, source_key, captured_at))
+
+    if not replayed:
         raise SystemExit("Replay completed but no CSV exports were generated.")
 
-    target_table = args.table or REPORT_TARGET_TABLES.get(args.report_name)
-    if not target_table:
-        raise SystemExit(
-            f"No target table configured for report '{args.report_name}'. Use --table to specify one."
-        )
+    print(f"\nConverting {len(replayed)} JRPrint file(s) to CSV...")
+    csv_paths = convert_to_csv([jrprint for _report, jrprint, _key, _at in replayed])
 
-    if len(chunk_records) == 1:
-        csv_path, source_key, captured_at = chunk_records[0]
-        ingest_csv(csv_path, args.report_name, source_key, captured_at, target_table)
-        print(
-            f"\nPipeline completed across 1 chunk. Report '{args.report_name}' ingested with source key '{source_key}'."
-        )
-    else:
-        print(f"\nIngesting {len(chunk_records)} chunks individually to avoid oversized uploads...")
-        for index, (csv_path, source_key, captured_at) in enumerate(chunk_records, 1):
-            print(f"-- Ingesting chunk {index}/{len(chunk_records)} → {csv_path.name}")
-            ingest_csv(csv_path, args.report_name, source_key, captured_at, target_table)
-        print(
-            f"\nPipeline completed across {len(chunk_records)} chunks. Latest source key: '{chunk_records[-1][1]}'."
-        )
+    for report_name in report_names:
+        chunk_records = [
+            (csv_path, source_key, captured_at)
+            for (name, _jrprint, source_key, captured_at), csv_path in zip(replayed, csv_paths)
+            if name == report_name
+        ]
+        target_table = target_tables[report_name]
+
+        if len(chunk_records) == 1:
+            csv_path, source_key, captured_at = chunk_records[0]
+            ingest_csv(csv_path, report_name, source_key, captured_at, target_table)
+            print(
+                f"\nPipeline completed across 1 chunk. Report '{report_name}' ingested with source key '{source_key}'."
+            )
+        else:
+            print(f"\nIngesting {len(chunk_records)} chunks individually to avoid oversized uploads...")
+            for index, (csv_path, source_key, captured_at) in enumerate(chunk_records, 1):
+                print(f"-- Ingesting chunk {index}/{len(chunk_records)} → {csv_path.name}")
+                ingest_csv(csv_path, report_name, source_key, captured_at, target_table)
+            print(
+                f"\nPipeline completed across {len(chunk_records)} chunks. Latest source key: '{chunk_records[-1][1]}'."
+            )
 
 
 if __name__ == "__main__":
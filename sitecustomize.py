@@ -1,5 +1,7 @@
-try:
-    import bcrypt  # type: ignore
+import sys
+
+
+def _patch_bcrypt_about(bcrypt) -> None:
     if not hasattr(bcrypt, "__about__"):
         class _About:
             __slots__ = ("__version__",)
@@ -12,5 +14,74 @@ try:
             "__about__",
             _About(getattr(bcrypt, "__version__", "0")),
         )
+
+
+class _PatchingLoader:
+    """Delegate to bcrypt's real loader, then patch the executed module."""
+
+    def __init__(self, finder, loader) -> None:
+        self._finder = finder
+        self._loader = loader
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        self._loader.exec_module(module)
+        self._finder.uninstall()
+        try:
+            _patch_bcrypt_about(module)
+        except Exception:
+            pass
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _BcryptAboutPatcher:
+    """
+    Patch ``bcrypt.__about__`` when bcrypt is first imported.
+
+    Importing bcrypt eagerly here would load its C extension on every
+    interpreter start, including scripts that never use it. The finder stays
+    installed until bcrypt has actually been executed, so lookups such as
+    importlib.util.find_spec() do not use it up.
+    """
+
+    def __init__(self) -> None:
+        self._resolving = False
+
+    def uninstall(self) -> None:
+        try:
+            sys.meta_path.remove(self)
+        except ValueError:
+            pass
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname != "bcrypt" or self._resolving:
+            return None
+        self._resolving = True
+        try:
+            spec = None
+            for finder in sys.meta_path:
+                find_spec = getattr(finder, "find_spec", None)
+                if finder is self or find_spec is None:
+                    continue
+                spec = find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+        finally:
+            self._resolving = False
+        if spec is None or spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        spec.loader = _PatchingLoader(self, spec.loader)
+        return spec
+
+
+try:
+    if "bcrypt" in sys.modules:
+        _patch_bcrypt_about(sys.modules["bcrypt"])
+    else:
+        sys.meta_path.insert(0, _BcryptAboutPatcher())
 except Exception:
     pass